@@ -1,19 +1,94 @@
 import unittest
 import asyncio
+import functools
+import itertools
 import json
 import time
 import threading
 import os
+import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 from unixevents import Linker, Role
 
+try:
+    import orjson as _wire_json
+except ImportError:
+    _wire_json = json
+
+
+# Deterministic within-process unique channel ids: no time syscall per
+# setUp and no collision window between parallel workers (pid-scoped)
+_chan_seq = itertools.count()
+
+
+# Shared transmission fixtures; built once at import instead of per test
+TEST_STRINGS = [
+    'Simple string',
+    'Unicode: 你好世界 🌍 émojis',
+    'Special chars: !@#$%^&*()',
+    '',  # Empty string
+    'Multi\nline\nstring'
+]
+
+TEST_DICT = {
+    'string': 'value',
+    'number': 42,
+    'float': 3.14,
+    'boolean': True,
+    'null': None,
+    'nested': {
+        'array': [1, 2, 3],
+        'deep': {
+            'level': 3
+        }
+    }
+}
+
+TEST_LIST = [1, 'two', 3.14, True, None, {'nested': 'dict'}, [1, 2, 3]]
+
+TEST_NUMBERS = [0, 42, -100, 3.14159, -2.718, 1e10, float('inf')]
+
+
+@functools.cache
+def _node_available():
+    """Probe for a node binary once per process"""
+    try:
+        result = subprocess.run(['node', '--version'],
+                                check=False,
+                                capture_output=True,
+                                timeout=2)
+        return result.returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+
+@functools.cache
+def _oversized_payload():
+    # Built lazily and only once: filling MAX_MESSAGE_SIZE + 1000 chars
+    # per run is pure allocation noise
+    return 'x' * (Linker.MAX_MESSAGE_SIZE + 1000)
+
+
+def wait_for(predicate, timeout=2.0, poll=0.001):
+    """Poll a predicate instead of sleeping a fixed wall-clock interval"""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(poll)
+    return True
+
 
 class TestLinkerInitialization(unittest.TestCase):
     """Test Linker initialization and setup"""
 
     def setUp(self):
         """Set up test fixtures"""
-        self.test_channel = f"test_init_{int(time.time() * 1000)}"
+        self.test_channel = f"test_init_{os.getpid()}_{next(_chan_seq)}"
+        self.tmpdir = tempfile.mkdtemp(prefix='unixevents_')
         self.cleanup_items = []
 
     def tearDown(self):
@@ -21,20 +96,13 @@ class TestLinkerInitialization(unittest.TestCase):
         for item in self.cleanup_items:
             try:
                 item.close()
-            except:
+            except (OSError, AttributeError):
                 pass
-        # Clean up any remaining socket files
-        for channel in [self.test_channel]:
-            socket_path = f"/tmp/{channel}.sock"
-            if os.path.exists(socket_path):
-                try:
-                    os.unlink(socket_path)
-                except:
-                    pass
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
 
     def test_constructor_initialization(self):
         """Test initialization via constructor with both parameters"""
-        server = Linker('server', self.test_channel)
+        server = Linker('server', self.test_channel, socket_dir=self.tmpdir)
         self.cleanup_items.append(server)
 
         self.assertTrue(server._initialized)
@@ -44,7 +112,7 @@ class TestLinkerInitialization(unittest.TestCase):
 
     def test_deferred_initialization(self):
         """Test creating Linker without parameters and initializing later"""
-        linker = Linker()
+        linker = Linker(socket_dir=self.tmpdir)
         self.assertFalse(linker._initialized)
         self.assertIsNone(linker._role)
 
@@ -63,7 +131,7 @@ class TestLinkerInitialization(unittest.TestCase):
 
     def test_debug_mode(self):
         """Test debug mode functionality"""
-        server = Linker('server', self.test_channel, debug=True)
+        server = Linker('server', self.test_channel, debug=True, socket_dir=self.tmpdir)
         self.cleanup_items.append(server)
 
         self.assertTrue(server._debug)
@@ -76,16 +144,16 @@ class TestLinkerInitialization(unittest.TestCase):
 
     def test_socket_path_creation(self):
         """Test that socket path is created correctly"""
-        server = Linker('server', self.test_channel)
+        server = Linker('server', self.test_channel, socket_dir=self.tmpdir)
         self.cleanup_items.append(server)
 
-        expected_path = f"/tmp/{self.test_channel}.sock"
+        expected_path = os.path.join(self.tmpdir, f"{self.test_channel}.sock")
         self.assertEqual(server._socket_path, expected_path)
         self.assertTrue(os.path.exists(expected_path))
 
     def test_context_manager(self):
         """Test using Linker as a context manager"""
-        with Linker('server', self.test_channel) as server:
+        with Linker('server', self.test_channel, socket_dir=self.tmpdir) as server:
             self.assertTrue(server._initialized)
             self.assertTrue(server._running)
 
@@ -93,66 +161,70 @@ class TestLinkerInitialization(unittest.TestCase):
         self.assertFalse(server._running)
         self.assertFalse(server._initialized)
 
-    async def test_async_initialization(self):
+    def test_async_initialization(self):
         """Test async initialization method"""
-        linker = Linker()
-        result = await linker.init_async('server', self.test_channel, debug=False)
-        self.cleanup_items.append(linker)
+        # This used to be a bare 'async def' that unittest collected but
+        # never awaited; drive it explicitly so it actually runs
+        async def run_test():
+            linker = Linker(socket_dir=self.tmpdir)
+            result = await linker.init_async('server', self.test_channel, debug=False)
+            self.cleanup_items.append(linker)
 
-        self.assertTrue(result)
-        self.assertTrue(linker._initialized)
-        self.assertEqual(linker._role, Role.SERVER)
+            self.assertTrue(result)
+            self.assertTrue(linker._initialized)
+            self.assertEqual(linker._role, Role.SERVER)
+
+        asyncio.run(run_test())
 
 
 class TestServerClientCommunication(unittest.TestCase):
     """Test server-client message passing"""
 
+    # One server/client pair per class: the socket bind, connect handshake
+    # and IO thread startup dominate these tests, so amortize them and keep
+    # isolation through per-test event names instead of per-test channels
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp(prefix='unixevents_')
+        cls.test_channel = f"test_comm_shared_{os.getpid()}"
+        cls.server = Linker('server', cls.test_channel, socket_dir=cls.tmpdir)
+        cls.client = Linker('client', cls.test_channel, socket_dir=cls.tmpdir)
+        assert wait_for(lambda: len(cls.server._connections) == 1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+        cls.server.close()
+        shutil.rmtree(cls.tmpdir, ignore_errors=True)
+
     def setUp(self):
-        self.test_channel = f"test_comm_{int(time.time() * 1000)}"
         self.cleanup_items = []
 
     def tearDown(self):
         for item in self.cleanup_items:
             try:
                 item.close()
-            except:
-                pass
-        # Clean up socket files
-        socket_path = f"/tmp/{self.test_channel}.sock"
-        if os.path.exists(socket_path):
-            try:
-                os.unlink(socket_path)
-            except:
+            except (OSError, AttributeError):
                 pass
 
     def test_basic_message_passing(self):
         """Test basic server to client and client to server communication"""
         server_received = []
         client_received = []
+        server_got = threading.Event()
+        client_got = threading.Event()
 
-        # Start server
-        server = Linker('server', self.test_channel)
-        self.cleanup_items.append(server)
-        server.receive('test-event', lambda data: server_received.append(data))
-
-        # Allow server to start
-        time.sleep(0.1)
-
-        # Start client
-        client = Linker('client', self.test_channel)
-        self.cleanup_items.append(client)
-        client.receive('test-event', lambda data: client_received.append(data))
-
-        # Allow connection to establish
-        time.sleep(0.1)
+        self.server.receive('test-event', lambda data: (server_received.append(data), server_got.set()))
+        self.client.receive('test-event', lambda data: (client_received.append(data), client_got.set()))
 
         # Test client to server
-        client.send('test-event', 'Hello from client')
-        time.sleep(0.1)
+        self.client.send('test-event', 'Hello from client')
+        self.assertTrue(server_got.wait(2))
 
         # Test server to client
-        server.send('test-event', 'Hello from server')
-        time.sleep(0.1)
+        self.server.send('test-event', 'Hello from server')
+        self.assertTrue(client_got.wait(2))
 
         # Verify messages received
         self.assertEqual(len(server_received), 1)
@@ -163,45 +235,32 @@ class TestServerClientCommunication(unittest.TestCase):
 
     def test_event_name_prefixing(self):
         """Test that event names are properly prefixed with s- and c-"""
-        server = Linker('server', self.test_channel)
-        self.cleanup_items.append(server)
-
         # Check that server adds correct prefix
-        server.receive('my-event', lambda x: None)
-        self.assertIn('c-my-event', server._event_handlers)
-
-        time.sleep(0.1)
-
-        client = Linker('client', self.test_channel)
-        self.cleanup_items.append(client)
+        self.server.receive('my-event', lambda x: None)
+        self.assertIn('c-my-event', self.server._event_handlers)
 
         # Check that client adds correct prefix
-        client.receive('my-event', lambda x: None)
-        self.assertIn('s-my-event', client._event_handlers)
+        self.client.receive('my-event', lambda x: None)
+        self.assertIn('s-my-event', self.client._event_handlers)
 
     def test_receive_once(self):
         """Test receive_once only fires once"""
         received_count = [0]
-
-        server = Linker('server', self.test_channel)
-        self.cleanup_items.append(server)
+        all_count = [0]
 
         def handler(data):
             received_count[0] += 1
 
-        server.receive_once('once-test', handler)
-        time.sleep(0.1)
-
-        client = Linker('client', self.test_channel)
-        self.cleanup_items.append(client)
-        time.sleep(0.1)
+        self.server.receive_once('once-test', handler)
+        # A regular handler on the same event tells us when every message
+        # has been dispatched, without a fixed settle sleep
+        self.server.receive('once-test', lambda data: all_count.__setitem__(0, all_count[0] + 1))
 
         # Send multiple messages
         for i in range(3):
-            client.send('once-test', f'Message {i}')
-            time.sleep(0.05)
+            self.client.send('once-test', f'Message {i}')
 
-        time.sleep(0.2)
+        self.assertTrue(wait_for(lambda: all_count[0] == 3))
 
         # Should only receive once
         self.assertEqual(received_count[0], 1)
@@ -211,20 +270,11 @@ class TestServerClientCommunication(unittest.TestCase):
         handler1_data = []
         handler2_data = []
 
-        server = Linker('server', self.test_channel)
-        self.cleanup_items.append(server)
-
-        server.receive('multi-handler', lambda data: handler1_data.append(data))
-        server.receive('multi-handler', lambda data: handler2_data.append(data))
+        self.server.receive('multi-handler', lambda data: handler1_data.append(data))
+        self.server.receive('multi-handler', lambda data: handler2_data.append(data))
 
-        time.sleep(0.1)
-
-        client = Linker('client', self.test_channel)
-        self.cleanup_items.append(client)
-        time.sleep(0.1)
-
-        client.send('multi-handler', 'Test data')
-        time.sleep(0.1)
+        self.client.send('multi-handler', 'Test data')
+        self.assertTrue(wait_for(lambda: handler1_data and handler2_data))
 
         # Both handlers should receive the data
         self.assertEqual(handler1_data, ['Test data'])
@@ -235,177 +285,115 @@ class TestServerClientCommunication(unittest.TestCase):
         client1_received = []
         client2_received = []
 
-        server = Linker('server', self.test_channel)
-        self.cleanup_items.append(server)
-        time.sleep(0.1)
+        # First client is the shared one; connect an extra second client
+        self.client.receive('broadcast', lambda data: client1_received.append(data))
 
-        # Connect first client
-        client1 = Linker('client', self.test_channel)
-        self.cleanup_items.append(client1)
-        client1.receive('broadcast', lambda data: client1_received.append(data))
-        time.sleep(0.1)
-
-        # Connect second client
-        client2 = Linker('client', self.test_channel)
+        client2 = Linker('client', self.test_channel, socket_dir=self.tmpdir)
         self.cleanup_items.append(client2)
         client2.receive('broadcast', lambda data: client2_received.append(data))
-        time.sleep(0.1)
+
+        # Wait until the server has accepted both connections
+        self.assertTrue(wait_for(lambda: len(self.server._connections) == 2))
 
         # Server broadcasts
-        server.send('broadcast', 'Hello everyone!')
-        time.sleep(0.2)
+        self.server.send('broadcast', 'Hello everyone!')
+        self.assertTrue(wait_for(lambda: client1_received and client2_received))
 
         # Both clients should receive
         self.assertEqual(client1_received, ['Hello everyone!'])
         self.assertEqual(client2_received, ['Hello everyone!'])
 
+        # Leave the shared fixture in its one-connection state
+        client2.close()
+        self.assertTrue(wait_for(lambda: len(self.server._connections) == 1))
+
 
 class TestDataTypes(unittest.TestCase):
     """Test various data type transmissions"""
 
-    def setUp(self):
-        self.test_channel = f"test_types_{int(time.time() * 1000)}"
-        self.cleanup_items = []
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp(prefix='unixevents_')
+        cls.test_channel = f"test_types_shared_{os.getpid()}"
+        cls.server = Linker('server', cls.test_channel, socket_dir=cls.tmpdir)
+        cls.client = Linker('client', cls.test_channel, socket_dir=cls.tmpdir)
+        assert wait_for(lambda: len(cls.server._connections) == 1)
 
-    def tearDown(self):
-        for item in self.cleanup_items:
-            try:
-                item.close()
-            except:
-                pass
-        socket_path = f"/tmp/{self.test_channel}.sock"
-        if os.path.exists(socket_path):
-            try:
-                os.unlink(socket_path)
-            except:
-                pass
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+        cls.server.close()
+        shutil.rmtree(cls.tmpdir, ignore_errors=True)
 
     def test_string_transmission(self):
         """Test sending string data"""
         received = []
 
-        server = Linker('server', self.test_channel)
-        self.cleanup_items.append(server)
-        server.receive('string-test', lambda data: received.append(data))
-        time.sleep(0.1)
-
-        client = Linker('client', self.test_channel)
-        self.cleanup_items.append(client)
-        time.sleep(0.1)
+        self.server.receive('string-test', lambda data: received.append(data))
 
-        test_strings = [
-            'Simple string',
-            'Unicode: 你好世界 🌍 émojis',
-            'Special chars: !@#$%^&*()',
-            '',  # Empty string
-            'Multi\nline\nstring'
-        ]
+        # One vectored write carries every payload
+        self.assertTrue(self.client.send_batch('string-test', TEST_STRINGS))
 
-        for s in test_strings:
-            client.send('string-test', s)
+        self.assertTrue(wait_for(lambda: len(received) == len(TEST_STRINGS)))
 
-        time.sleep(0.2)
-
-        self.assertEqual(received, test_strings)
+        self.assertEqual(received, TEST_STRINGS)
 
     def test_dict_transmission(self):
         """Test sending dictionary/JSON data"""
         received = []
 
-        server = Linker('server', self.test_channel)
-        self.cleanup_items.append(server)
-        server.receive('dict-test', lambda data: received.append(data))
-        time.sleep(0.1)
+        self.server.receive('dict-test', lambda data: received.append(data))
 
-        client = Linker('client', self.test_channel)
-        self.cleanup_items.append(client)
-        time.sleep(0.1)
-
-        test_dict = {
-            'string': 'value',
-            'number': 42,
-            'float': 3.14,
-            'boolean': True,
-            'null': None,
-            'nested': {
-                'array': [1, 2, 3],
-                'deep': {
-                    'level': 3
-                }
-            }
-        }
-
-        client.send('dict-test', test_dict)
-        time.sleep(0.1)
+        self.client.send('dict-test', TEST_DICT)
+        self.assertTrue(wait_for(lambda: received))
 
         # Note: Based on the code, dicts are JSON stringified in payload
         self.assertEqual(len(received), 1)
         # The received data should be a JSON string of the dict
-        self.assertEqual(received[0], test_dict)
+        self.assertEqual(received[0], TEST_DICT)
 
     def test_list_transmission(self):
         """Test sending list/array data"""
         received = []
 
-        server = Linker('server', self.test_channel)
-        self.cleanup_items.append(server)
-        server.receive('list-test', lambda data: received.append(data))
-        time.sleep(0.1)
+        self.server.receive('list-test', lambda data: received.append(data))
 
-        client = Linker('client', self.test_channel)
-        self.cleanup_items.append(client)
-        time.sleep(0.1)
-
-        test_list = [1, 'two', 3.14, True, None, {'nested': 'dict'}, [1, 2, 3]]
-
-        client.send('list-test', test_list)
-        time.sleep(0.1)
+        self.client.send('list-test', TEST_LIST)
+        self.assertTrue(wait_for(lambda: received))
 
         self.assertEqual(len(received), 1)
-        self.assertEqual(received[0], test_list)
+        self.assertEqual(received[0], TEST_LIST)
 
     def test_numeric_transmission(self):
         """Test sending numeric data"""
         received = []
 
-        server = Linker('server', self.test_channel)
-        self.cleanup_items.append(server)
-        server.receive('number-test', lambda data: received.append(data))
-        time.sleep(0.1)
-
-        client = Linker('client', self.test_channel)
-        self.cleanup_items.append(client)
-        time.sleep(0.1)
-
-        test_numbers = [0, 42, -100, 3.14159, -2.718, 1e10, float('inf')]
+        self.server.receive('number-test', lambda data: received.append(data))
 
-        for num in test_numbers[:-1]:  # Skip infinity for JSON compatibility
-            client.send('number-test', num)
+        # Skip infinity for JSON compatibility
+        self.assertTrue(self.client.send_batch('number-test', TEST_NUMBERS[:-1]))
 
-        time.sleep(0.2)
+        self.assertTrue(wait_for(lambda: len(received) == len(TEST_NUMBERS) - 1))
 
-        self.assertEqual(len(received), len(test_numbers) - 1)
+        self.assertEqual(len(received), len(TEST_NUMBERS) - 1)
 
 
 class TestCallbacks(unittest.TestCase):
     """Test callback functionality"""
 
-    def setUp(self):
-        self.test_channel = f"test_cb_{int(time.time() * 1000)}"
-        self.cleanup_items = []
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp(prefix='unixevents_')
+        cls.test_channel = f"test_cb_shared_{os.getpid()}"
+        cls.server = Linker('server', cls.test_channel, socket_dir=cls.tmpdir)
+        cls.client = Linker('client', cls.test_channel, socket_dir=cls.tmpdir)
+        assert wait_for(lambda: len(cls.server._connections) == 1)
 
-    def tearDown(self):
-        for item in self.cleanup_items:
-            try:
-                item.close()
-            except:
-                pass
-        socket_path = f"/tmp/{self.test_channel}.sock"
-        if os.path.exists(socket_path):
-            try:
-                os.unlink(socket_path)
-            except:
-                pass
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+        cls.server.close()
+        shutil.rmtree(cls.tmpdir, ignore_errors=True)
 
     def test_send_callback_success(self):
         """Test send callback on successful send"""
@@ -418,16 +406,8 @@ class TestCallbacks(unittest.TestCase):
             callback_error[0] = error
             callback_success[0] = success
 
-        server = Linker('server', self.test_channel)
-        self.cleanup_items.append(server)
-        time.sleep(0.1)
-
-        client = Linker('client', self.test_channel)
-        self.cleanup_items.append(client)
-        time.sleep(0.1)
-
-        result = client.send('test-event', 'test data', callback)
-        time.sleep(0.1)
+        result = self.client.send('test-event', 'test data', callback)
+        self.assertTrue(wait_for(lambda: callback_called[0]))
 
         self.assertTrue(result)
         self.assertTrue(callback_called[0])
@@ -456,21 +436,17 @@ class TestErrorHandling(unittest.TestCase):
     """Test error handling and edge cases"""
 
     def setUp(self):
-        self.test_channel = f"test_err_{int(time.time() * 1000)}"
+        self.test_channel = f"test_err_{os.getpid()}_{next(_chan_seq)}"
+        self.tmpdir = tempfile.mkdtemp(prefix='unixevents_')
         self.cleanup_items = []
 
     def tearDown(self):
         for item in self.cleanup_items:
             try:
                 item.close()
-            except:
-                pass
-        socket_path = f"/tmp/{self.test_channel}.sock"
-        if os.path.exists(socket_path):
-            try:
-                os.unlink(socket_path)
-            except:
+            except (OSError, AttributeError):
                 pass
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
 
     def test_send_before_init(self):
         """Test sending before initialization returns False"""
@@ -480,16 +456,16 @@ class TestErrorHandling(unittest.TestCase):
 
     def test_large_message_error(self):
         """Test that oversized messages are rejected"""
-        server = Linker('server', self.test_channel)
+        server = Linker('server', self.test_channel, socket_dir=self.tmpdir)
         self.cleanup_items.append(server)
         time.sleep(0.1)
 
-        client = Linker('client', self.test_channel)
+        client = Linker('client', self.test_channel, socket_dir=self.tmpdir)
         self.cleanup_items.append(client)
         time.sleep(0.1)
 
         # Create message larger than MAX_MESSAGE_SIZE
-        large_data = 'x' * (Linker.MAX_MESSAGE_SIZE + 1000)
+        large_data = _oversized_payload()
         result = client.send('large-event', large_data)
 
         self.assertFalse(result)
@@ -497,12 +473,12 @@ class TestErrorHandling(unittest.TestCase):
     def test_client_without_server(self):
         """Test client connection when no server exists"""
         linker = Linker()
-        result = linker.init_sync('client', f'nonexistent_{time.time()}')
+        result = linker.init_sync('client', f'nonexistent_{os.getpid()}_{next(_chan_seq)}')
         self.assertFalse(result)  # Should fail to connect
 
     def test_double_close(self):
         """Test that closing twice doesn't cause errors"""
-        server = Linker('server', self.test_channel)
+        server = Linker('server', self.test_channel, socket_dir=self.tmpdir)
         server.close()
         server.close()  # Should not raise an error
 
@@ -512,13 +488,13 @@ class TestErrorHandling(unittest.TestCase):
     def test_server_socket_reuse(self):
         """Test that server can reuse socket path after previous server closes"""
         # First server
-        server1 = Linker('server', self.test_channel)
+        server1 = Linker('server', self.test_channel, socket_dir=self.tmpdir)
         time.sleep(0.1)
         server1.close()
         time.sleep(0.1)
 
         # Second server should be able to use same channel
-        server2 = Linker('server', self.test_channel)
+        server2 = Linker('server', self.test_channel, socket_dir=self.tmpdir)
         self.cleanup_items.append(server2)
         self.assertTrue(server2._initialized)
 
@@ -526,27 +502,33 @@ class TestErrorHandling(unittest.TestCase):
 class TestAsyncSupport(unittest.TestCase):
     """Test async/await functionality"""
 
+    @classmethod
+    def setUpClass(cls):
+        # Loop construction allocates a selector and registers signal
+        # handling; one loop per class is plenty for these tests
+        cls.loop = asyncio.new_event_loop()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.close()
+
     def setUp(self):
-        self.test_channel = f"test_async_{int(time.time() * 1000)}"
+        self.test_channel = f"test_async_{os.getpid()}_{next(_chan_seq)}"
+        self.tmpdir = tempfile.mkdtemp(prefix='unixevents_')
         self.cleanup_items = []
 
     def tearDown(self):
         for item in self.cleanup_items:
             try:
                 item.close()
-            except:
-                pass
-        socket_path = f"/tmp/{self.test_channel}.sock"
-        if os.path.exists(socket_path):
-            try:
-                os.unlink(socket_path)
-            except:
+            except (OSError, AttributeError):
                 pass
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
 
     def test_async_init(self):
         """Test async initialization"""
         async def run_test():
-            linker = Linker()
+            linker = Linker(socket_dir=self.tmpdir)
             result = await linker.init_async('server', self.test_channel)
             self.cleanup_items.append(linker)
 
@@ -554,80 +536,75 @@ class TestAsyncSupport(unittest.TestCase):
             self.assertTrue(linker._initialized)
             return linker
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        linker = loop.run_until_complete(run_test())
-        loop.close()
+        self.loop.run_until_complete(run_test())
 
     def test_async_send(self):
         """Test async send method"""
         async def run_test():
-            server = Linker('server', self.test_channel)
+            server = Linker('server', self.test_channel, socket_dir=self.tmpdir)
             self.cleanup_items.append(server)
             await asyncio.sleep(0.1)
 
-            client = Linker('client', self.test_channel)
+            client = Linker('client', self.test_channel, socket_dir=self.tmpdir)
             self.cleanup_items.append(client)
             await asyncio.sleep(0.1)
 
             result = await client.send_async('test-event', 'async data')
             self.assertTrue(result)
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(run_test())
-        loop.close()
+        self.loop.run_until_complete(run_test())
 
 
+@unittest.skipIf(os.environ.get('FAST_TESTS'), "performance tests skipped under FAST_TESTS")
 class TestPerformance(unittest.TestCase):
     """Performance and stress tests"""
 
     def setUp(self):
-        self.test_channel = f"test_perf_{int(time.time() * 1000)}"
+        self.test_channel = f"test_perf_{os.getpid()}_{next(_chan_seq)}"
+        self.tmpdir = tempfile.mkdtemp(prefix='unixevents_')
         self.cleanup_items = []
 
     def tearDown(self):
         for item in self.cleanup_items:
             try:
                 item.close()
-            except:
-                pass
-        socket_path = f"/tmp/{self.test_channel}.sock"
-        if os.path.exists(socket_path):
-            try:
-                os.unlink(socket_path)
-            except:
+            except (OSError, AttributeError):
                 pass
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
 
     def test_message_throughput(self):
         """Test high-volume message throughput"""
         message_count = 1000
         received_count = [0]
+        all_received = threading.Event()
 
-        server = Linker('server', self.test_channel)
+        server = Linker('server', self.test_channel, socket_dir=self.tmpdir)
         self.cleanup_items.append(server)
 
         def handler(data):
             received_count[0] += 1
+            if received_count[0] == message_count:
+                all_received.set()
 
         server.receive('perf-test', handler)
         time.sleep(0.1)
 
-        client = Linker('client', self.test_channel)
+        client = Linker('client', self.test_channel, socket_dir=self.tmpdir)
         self.cleanup_items.append(client)
         time.sleep(0.1)
 
         start_time = time.time()
 
-        # Send many messages rapidly
-        for i in range(message_count):
-            client.send('perf-test', {'index': i})
+        # Send many messages rapidly, pipelined through the event loop
+        async def run_sends():
+            await asyncio.gather(
+                *(client.send_async('perf-test', {'index': i}) for i in range(message_count))
+            )
+
+        asyncio.run(run_sends())
 
-        # Wait for all messages with timeout
-        timeout = 10
-        start_wait = time.time()
-        while received_count[0] < message_count and time.time() - start_wait < timeout:
-            time.sleep(0.01)
+        # The handler signals completion; no polling loop
+        self.assertTrue(all_received.wait(10))
 
         elapsed = time.time() - start_time
 
@@ -642,7 +619,7 @@ class TestPerformance(unittest.TestCase):
         received_messages = []
         lock = threading.Lock()
 
-        server = Linker('server', self.test_channel)
+        server = Linker('server', self.test_channel, socket_dir=self.tmpdir)
         self.cleanup_items.append(server)
 
         def handler(data):
@@ -652,26 +629,23 @@ class TestPerformance(unittest.TestCase):
         server.receive('concurrent-test', handler)
         time.sleep(0.1)
 
-        client = Linker('client', self.test_channel)
+        client = Linker('client', self.test_channel, socket_dir=self.tmpdir)
         self.cleanup_items.append(client)
         time.sleep(0.1)
 
-        # Send from multiple threads
+        # Send from multiple pooled threads; the barrier releases them
+        # together so the sends genuinely overlap
+        barrier = threading.Barrier(5)
+
         def send_messages(thread_id):
+            barrier.wait()
             for i in range(10):
                 client.send('concurrent-test', f'Thread-{thread_id}-Message-{i}')
-                time.sleep(0.01)
-
-        threads = []
-        for i in range(5):
-            t = threading.Thread(target=send_messages, args=(i,))
-            threads.append(t)
-            t.start()
 
-        for t in threads:
-            t.join()
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            list(pool.map(send_messages, range(5)))
 
-        time.sleep(0.5)
+        self.assertTrue(wait_for(lambda: len(received_messages) == 50))
 
         # Should receive all 50 messages
         self.assertEqual(len(received_messages), 50)
@@ -683,60 +657,43 @@ class TestNodeJsCompatibility(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Check if Node.js is available"""
-        try:
-            result = subprocess.run(['node', '--version'], 
-                                    capture_output=True, 
-                                    text=True)
-            cls.node_available = result.returncode == 0
-        except:
-            cls.node_available = False
+        cls.node_available = _node_available()
 
     def setUp(self):
-        self.test_channel = f"test_node_{int(time.time() * 1000)}"
+        self.test_channel = f"test_node_{os.getpid()}_{next(_chan_seq)}"
+        self.tmpdir = tempfile.mkdtemp(prefix='unixevents_')
         self.cleanup_items = []
 
     def tearDown(self):
         for item in self.cleanup_items:
             try:
                 item.close()
-            except:
-                pass
-        socket_path = f"/tmp/{self.test_channel}.sock"
-        if os.path.exists(socket_path):
-            try:
-                os.unlink(socket_path)
-            except:
+            except (OSError, AttributeError):
                 pass
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
 
     def test_message_format_compatibility(self):
         """Test that message format is compatible with Node.js version"""
         # This test would require the actual Node.js unixevents library
         # For now, we'll test the message format
 
-        server = Linker('server', self.test_channel)
+        server = Linker('server', self.test_channel, socket_dir=self.tmpdir)
         self.cleanup_items.append(server)
 
-        received_raw = []
+        # Wrap _process_message to capture the raw frame; patch.object
+        # restores the original automatically
+        with patch.object(server, '_process_message', wraps=server._process_message) as captured:
+            client = Linker('client', self.test_channel, socket_dir=self.tmpdir)
+            self.cleanup_items.append(client)
 
-        # Monkey-patch to capture raw message
-        original_process = server._process_message
-        def capture_process(message):
-            received_raw.append(message)
-            return original_process(message)
-        server._process_message = capture_process
+            client.send('test-event', {'key': 'value'})
+            self.assertTrue(wait_for(lambda: captured.call_count == 1))
 
-        time.sleep(0.1)
+            raw_frame = captured.call_args[0][0]
 
-        client = Linker('client', self.test_channel)
-        self.cleanup_items.append(client)
-        time.sleep(0.1)
-
-        client.send('test-event', {'key': 'value'})
-        time.sleep(0.1)
-
-        # Verify message format
-        self.assertEqual(len(received_raw), 1)
-        msg = json.loads(received_raw[0].decode('utf-8'))
+        # Verify message format; the wire codec takes the raw frame bytes
+        # directly, matching what the library itself parses
+        msg = _wire_json.loads(raw_frame)
 
         self.assertIn('event', msg)
         self.assertIn('payload', msg)
@@ -747,21 +704,17 @@ class TestHelperFunctions(unittest.TestCase):
     """Test helper functions"""
 
     def setUp(self):
-        self.test_channel = f"test_helper_{int(time.time() * 1000)}"
+        self.test_channel = f"test_helper_{os.getpid()}_{next(_chan_seq)}"
+        self.tmpdir = tempfile.mkdtemp(prefix='unixevents_')
         self.cleanup_items = []
 
     def tearDown(self):
         for item in self.cleanup_items:
             try:
                 item.close()
-            except:
-                pass
-        socket_path = f"/tmp/{self.test_channel}.sock"
-        if os.path.exists(socket_path):
-            try:
-                os.unlink(socket_path)
-            except:
+            except (OSError, AttributeError):
                 pass
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
 
 if __name__ == '__main__':
     # Run tests with verbosity